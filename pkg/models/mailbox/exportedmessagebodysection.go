@@ -18,6 +18,8 @@ import (
 
 const EMAIL_EXPORT_TIMESTAMP_FORMAT = "20060102150405"
 
+var illegalCharsRe = regexp.MustCompile(`[^a-zA-Z0-9\-_]`)
+
 type ExportedEmailMetadata struct {
 	Subject     string    `json:"subject"`
 	From        string    `json:"from"`
@@ -141,10 +143,23 @@ func getExtension(contentType string) string {
 }
 
 func sanitize(input string) string {
-	illegalCharsRe := regexp.MustCompile(`[^a-zA-Z0-9\-_]`)
+	// Most mailbox names are already safe, so skip the regex when there is nothing to replace
+	if isSanitized(input) {
+		return input
+	}
 	return illegalCharsRe.ReplaceAllString(input, "_")
 }
 
+func isSanitized(input string) bool {
+	for i := 0; i < len(input); i++ {
+		c := input[i]
+		if !(c >= 'a' && c <= 'z' || c >= 'A' && c <= 'Z' || c >= '0' && c <= '9' || c == '-' || c == '_') {
+			return false
+		}
+	}
+	return true
+}
+
 func ExportedEmailContainerFactory(mailboxName string, msg *imap.Message) ([]ExportedEmailContainer, error) {
 	containers := []ExportedEmailContainer{}
 	for bodySectionName, literal := range msg.Body {